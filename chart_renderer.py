@@ -0,0 +1,289 @@
+import multiprocessing
+import os
+import threading
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+class ChartTemplate:
+    """
+    Pre-styled price trend figure built once with the object-oriented
+    Figure/FigureCanvasAgg API. Each render only swaps in new data, so
+    no global pyplot state is touched.
+    """
+
+    def __init__(self):
+        self.figure = Figure(figsize=(10, 5))
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111)
+
+        # Artists are created once and only get new data on each render
+        self.price_line, = self.ax.plot([], [], marker='o', linewidth=2,
+                                        label='Past Avg Price', color='#3b82f6',
+                                        markersize=6)
+        self.current_line = self.ax.axhline(y=0, color='#10b981', linestyle='--',
+                                            linewidth=1.5, label='Current')
+        self.target_line = self.ax.axhline(y=0, color='#ef4444', linestyle='--',
+                                           linewidth=1.5, label='Target')
+
+        # Styling
+        self.ax.set_ylabel('Price (₹)', fontsize=11, fontweight='bold')
+        self.ax.set_xlabel('Month', fontsize=11, fontweight='bold')
+        self.title = self.ax.set_title('', fontsize=13, fontweight='bold')
+        self.legend = self.ax.legend(loc='best', framealpha=0.9)
+        self.ax.grid(alpha=0.3, linestyle=':', linewidth=0.5)
+
+    def render(self, product_name, current_price, target_price, df, filename):
+        """
+        Load new data into the template and save it to filename.
+        """
+        months = df['month'].tolist()
+        positions = list(range(len(months)))
+
+        self.price_line.set_data(positions, df['price'].tolist())
+        self.current_line.set_ydata([current_price, current_price])
+        self.target_line.set_ydata([target_price, target_price])
+
+        # Months are plotted by position so old categories never linger
+        self.ax.set_xticks(positions)
+        self.ax.set_xticklabels(months, rotation=45, ha='right')
+
+        legend_texts = self.legend.get_texts()
+        legend_texts[1].set_text(f'Current: ₹{current_price}')
+        legend_texts[2].set_text(f'Target: ₹{target_price}')
+        self.title.set_text(f'Price Trend: {product_name[:50]}')
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.figure.tight_layout()
+
+        self.figure.savefig(filename, dpi=150, bbox_inches='tight', facecolor='white')
+        return filename
+
+
+# Idle templates shared by all threads; a template is only used by one
+# render at a time. Extra templates built for overlapping renders are
+# dropped on release, since the GIL gives no speedup from keeping them.
+MAX_IDLE_TEMPLATES = 2
+_templates = []
+_templates_lock = threading.Lock()
+
+
+def _acquire_template():
+    """Take an idle template, building a new one if all are busy."""
+    with _templates_lock:
+        if _templates:
+            return _templates.pop()
+    return ChartTemplate()
+
+
+def _release_template(template):
+    """Return a template to the idle pool, or drop it if the pool is full."""
+    with _templates_lock:
+        if len(_templates) < MAX_IDLE_TEMPLATES:
+            _templates.append(template)
+
+
+def build_chart_filename(product_name, static_dir='static'):
+    """
+    Build a safe, timestamped chart path inside static_dir.
+    """
+    # Create safe filename (limit length and remove special characters)
+    safe_name = "".join([c if c.isalnum() or c in (' ', '-') else "_"
+                        for c in product_name])
+    safe_name = safe_name[:50]  # Limit length to avoid filesystem issues
+
+    # Add timestamp and a random suffix so batch renders never overwrite
+    # each other, even for identical names within the same second
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    suffix = uuid.uuid4().hex[:8]
+    return f"{static_dir}/{safe_name}_{timestamp}_{suffix}_trend.png"
+
+
+def render_chart(product_name, current_price, target_price, df, static_dir='static'):
+    """
+    Render a price trend chart in this process using a reusable template.
+    Safe to call from several threads at once.
+    Returns the saved file path, or None if the data can't be plotted.
+    """
+    try:
+        # Validate inputs
+        if df is None or df.empty:
+            print("⚠️ No data available to plot")
+            return None
+
+        if not current_price or current_price <= 0:
+            print("⚠️ Invalid current price for plotting")
+            return None
+
+        os.makedirs(static_dir, exist_ok=True)
+        filename = build_chart_filename(product_name, static_dir)
+        template = _acquire_template()
+        try:
+            template.render(product_name, current_price, target_price, df, filename)
+        finally:
+            _release_template(template)
+
+        print(f"✅ Price trend chart saved: {filename}")
+        return filename
+
+    except Exception as e:
+        print(f"⚠️ Error creating price plot: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def _render_job(job):
+    """Worker entry point: unpack a job dict and render it."""
+    return render_chart(
+        job['product_name'],
+        job['current_price'],
+        job['target_price'],
+        job['df'],
+        job.get('static_dir', 'static')
+    )
+
+
+class ChartRenderer:
+    """
+    Small pool of render processes for batch jobs, each worker keeping its
+    own chart templates. Safe to share between threads.
+    """
+
+    def __init__(self, max_workers=2):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        # Workers are only started on the first render. Spawn avoids
+        # forking a multithreaded server process.
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _discard_executor(self, executor):
+        """Drop a broken pool so the next call builds a fresh one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_jobs(self, jobs, indexes, results):
+        """
+        Render jobs[i] for each i in indexes into results[i].
+        Returns the indexes that failed because the pool broke or was
+        shut down by another thread.
+        """
+        executor = self._get_executor()
+        futures = {}
+        broken = []
+
+        try:
+            for i in indexes:
+                futures[i] = executor.submit(_render_job, jobs[i])
+        except (BrokenProcessPool, RuntimeError):
+            # RuntimeError: the pool was shut down while we were submitting
+            broken = [i for i in indexes if i not in futures]
+
+        for i, future in futures.items():
+            try:
+                results[i] = future.result()
+            except (BrokenProcessPool, CancelledError):
+                broken.append(i)
+            except Exception as e:
+                print(f"⚠️ Error rendering chart for {jobs[i].get('product_name')}: {e}")
+
+        if broken:
+            self._discard_executor(executor)
+        return sorted(broken)
+
+    def render_many(self, jobs):
+        """
+        Render charts for many products in one call.
+        Each job is a dict with product_name, current_price, target_price,
+        df and an optional static_dir. Returns file paths in job order,
+        with None for any chart that failed.
+        """
+        jobs = list(jobs)
+        results = [None] * len(jobs)
+        if not jobs:
+            return results
+
+        broken = self._run_jobs(jobs, range(len(jobs)), results)
+        if broken:
+            # A worker died or the pool was shut down; retry the lost
+            # jobs once on a fresh pool
+            print(f"⚠️ Chart render pool broke, retrying {len(broken)} job(s)")
+            broken = self._run_jobs(jobs, broken, results)
+            if broken:
+                print(f"⚠️ Chart render pool broke again, {len(broken)} chart(s) not rendered")
+
+        return results
+
+    def shutdown(self):
+        """Stop the render processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+if __name__ == '__main__':
+    # Batch demo and self-check: python chart_renderer.py
+    import tempfile
+    import pandas as pd
+
+    def _dummy_prices(count, base):
+        return pd.DataFrame({
+            'month': [f'M{i}' for i in range(count)],
+            'price': [base + i * 100 for i in range(count)],
+        })
+
+    out_dir = tempfile.mkdtemp(prefix='charts_')
+
+    # One template reused for data of different lengths must not keep
+    # ticks or limits from the previous render
+    template = ChartTemplate()
+    template.render('Long', 5000, 4500, _dummy_prices(12, 5000),
+                    os.path.join(out_dir, 'long.png'))
+    template.render('Short', 900, 800, _dummy_prices(3, 1000),
+                    os.path.join(out_dir, 'short.png'))
+    assert list(template.ax.get_xticks()) == [0, 1, 2]
+    assert [t.get_text() for t in template.ax.get_xticklabels()] == ['M0', 'M1', 'M2']
+    x_low, x_high = template.ax.get_xlim()
+    y_low, y_high = template.ax.get_ylim()
+    assert x_low < 0 and 2 < x_high < 3
+    assert y_low < 800 and 1200 < y_high < 4500
+
+    # Batch renders with colliding names must get distinct files
+    long_name = 'x' * 50
+    names = ['Same Product'] * 3 + [long_name + 'A', long_name + 'B']
+    jobs = [{
+        'product_name': name,
+        'current_price': 1000,
+        'target_price': 900,
+        'df': _dummy_prices(12, 1000),
+        'static_dir': out_dir,
+    } for name in names]
+
+    renderer = ChartRenderer()
+    try:
+        paths = renderer.render_many(jobs)
+    finally:
+        renderer.shutdown()
+
+    assert None not in paths
+    assert len(set(paths)) == len(paths)
+    assert all(os.path.exists(path) for path in paths)
+    print(f"✅ Rendered {len(paths)} charts into {out_dir}")
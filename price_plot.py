@@ -1,10 +1,8 @@
 import pandas as pd
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for server environments
-import matplotlib.pyplot as plt
 import random
 import os
 from datetime import datetime
+from chart_renderer import render_chart
 
 
 def generate_dummy_past_prices(current_price):
@@ -43,62 +41,9 @@ def plot_price_trend(product_name, current_price, target_price, df):
     """
     Plot price trend for the product using dummy past data
     and save the graph image inside the /static folder.
+    Rendered with a template from a shared pool, so this is thread-safe.
     """
-    try:
-        # Validate inputs
-        if df is None or df.empty:
-            print("⚠️ No data available to plot")
-            return None
-        
-        if not current_price or current_price <= 0:
-            print("⚠️ Invalid current price for plotting")
-            return None
-        
-        # Create figure
-        plt.figure(figsize=(10, 5))
-        plt.plot(df['month'], df['price'], marker='o', linewidth=2, 
-                label='Past Avg Price', color='#3b82f6', markersize=6)
-
-        # Highlight lines for current and target prices
-        plt.axhline(y=current_price, color='#10b981', linestyle='--', 
-                   linewidth=1.5, label=f'Current: ₹{current_price}')
-        plt.axhline(y=target_price, color='#ef4444', linestyle='--', 
-                   linewidth=1.5, label=f'Target: ₹{target_price}')
-
-        # Styling
-        plt.xticks(rotation=45, ha='right')
-        plt.ylabel('Price (₹)', fontsize=11, fontweight='bold')
-        plt.xlabel('Month', fontsize=11, fontweight='bold')
-        plt.title(f'Price Trend: {product_name[:50]}', fontsize=13, fontweight='bold')
-        plt.legend(loc='best', framealpha=0.9)
-        plt.grid(alpha=0.3, linestyle=':', linewidth=0.5)
-        plt.tight_layout()
-
-        # Save plot to static directory
-        os.makedirs('static', exist_ok=True)
-        
-        # Create safe filename (limit length and remove special characters)
-        safe_name = "".join([c if c.isalnum() or c in (' ', '-') else "_" 
-                            for c in product_name])
-        safe_name = safe_name[:50]  # Limit length to avoid filesystem issues
-        
-        # Add timestamp to avoid overwriting
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"static/{safe_name}_{timestamp}_trend.png"
-        
-        plt.savefig(filename, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close('all')  # Close all figures to free memory
-        
-        print(f"✅ Price trend chart saved: {filename}")
-        return filename
-    
-    except Exception as e:
-        print(f"⚠️ Error creating price plot: {e}")
-        import traceback
-        traceback.print_exc()
-        # Make sure to close any open figures
-        plt.close('all')
-        return None
+    return render_chart(product_name, current_price, target_price, df)
 
 
 def get_recommendation(current_price, df, target_price):
@@ -0,0 +1,77 @@
+import argparse
+import os
+import pandas as pd
+from chart_renderer import ChartRenderer
+from price_plot import generate_dummy_past_prices
+
+CSV_FILE = 'price_history.csv'
+
+
+def load_tracked_products(csv_file=CSV_FILE):
+    """
+    Read the tracking history and return the latest entry for each product.
+    """
+    if not os.path.exists(csv_file):
+        print(f"⚠️ CSV file not found: {csv_file}")
+        return []
+
+    try:
+        df = pd.read_csv(csv_file)
+
+        # Get latest entry for each unique product
+        df['datetime'] = pd.to_datetime(df['date'] + ' ' + df['time'])
+        df = df.sort_values('datetime', ascending=False)
+        latest_products = df.groupby('product_id').first().reset_index()
+
+        return latest_products.to_dict('records')
+
+    except Exception as e:
+        print(f"⚠️ Error reading history: {e}")
+        return []
+
+
+def regenerate_all_charts(csv_file=CSV_FILE, target_ratio=0.9, static_dir='static',
+                          max_workers=2):
+    """
+    Regenerate price trend charts for every tracked product in one batch.
+    Target prices aren't stored in the history, so each chart's target
+    line is drawn at target_ratio times the latest price.
+    Returns a dict of product_id to chart path (None if it failed).
+    """
+    products = [p for p in load_tracked_products(csv_file) if p['price'] > 0]
+    if not products:
+        print("⚠️ No tracked products to chart")
+        return {}
+
+    jobs = []
+    for product in products:
+        jobs.append({
+            'product_name': product['product_name'],
+            'current_price': product['price'],
+            'target_price': round(product['price'] * target_ratio, 2),
+            'df': generate_dummy_past_prices(product['price']),
+            'static_dir': static_dir,
+        })
+
+    renderer = ChartRenderer(max_workers=max_workers)
+    try:
+        paths = renderer.render_many(jobs)
+    finally:
+        renderer.shutdown()
+
+    rendered = sum(1 for path in paths if path)
+    print(f"📊 Regenerated {rendered}/{len(jobs)} chart(s)")
+    return {p['product_id']: path for p, path in zip(products, paths)}
+
+
+if __name__ == '__main__':
+    # Guard keeps spawned render workers from re-running the batch
+    parser = argparse.ArgumentParser(description="Regenerate charts for all tracked products.")
+    parser.add_argument('--csv', default=CSV_FILE, help="price history CSV file")
+    parser.add_argument('--target-ratio', type=float, default=0.9,
+                        help="target price as a fraction of the latest price")
+    parser.add_argument('--static-dir', default='static', help="output directory for charts")
+    parser.add_argument('--workers', type=int, default=2, help="number of render processes")
+    args = parser.parse_args()
+
+    regenerate_all_charts(args.csv, args.target_ratio, args.static_dir, args.workers)